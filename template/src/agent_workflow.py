@@ -2,23 +2,95 @@
 # Complete 6-node software development lifecycle automation
 
 from pocketflow import Node, Flow
+import hashlib
 import os
-import json
-import subprocess
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Union
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
-def call_llm(prompt: str, system_prompt: str = "") -> str:
+# Timestamp formats, defined once at module scope so every strftime call
+# reuses the same format string
+_TS_FMT = '%Y-%m-%d %H:%M:%S'
+_DATE_FMT = '%Y-%m-%d'
+_PROJECT_ID_FMT = '%Y%m%d_%H%M%S'
+
+# Content-addressed LLM response cache: in-memory dict backed by one file
+# per response, keyed by SHA-256 of (system_prompt, prompt). Identical
+# prompts (e.g. unchanged components across testing iterations, or re-runs
+# of the same session) never hit the API twice. The cache lives under the
+# user's home directory, not the generated project tree, so push_to_git's
+# "git add ." never sweeps raw LLM responses into the repository.
+_LLM_CACHE_DIR = os.path.expanduser("~/.cache/agent_workflow/llm")
+_llm_memory_cache: Dict[str, str] = {}
+
+def _llm_cache_key(prompt: str, system_prompt: str) -> str:
+    return hashlib.sha256((system_prompt + "\x00" + prompt).encode("utf-8")).hexdigest()
+
+def _llm_cache_get(key: str) -> Optional[str]:
+    if key in _llm_memory_cache:
+        return _llm_memory_cache[key]
+    cache_path = os.path.join(_LLM_CACHE_DIR, key)
+    if os.path.isfile(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            response = f.read()
+        _llm_memory_cache[key] = response
+        return response
+    return None
+
+def _llm_cache_put(key: str, response: str) -> None:
+    _llm_memory_cache[key] = response
+    os.makedirs(_LLM_CACHE_DIR, exist_ok=True)
+    with open(os.path.join(_LLM_CACHE_DIR, key), 'w', encoding='utf-8') as f:
+        f.write(response)
+
+def _call_llm_api(prompts: List[str], system_prompt: str = "") -> List[str]:
     """
     Simulate LLM call - replace with actual LLM API call
+
+    Receives a batch of prompts packed into one API request (e.g. OpenAI
+    n=/multi-message) so N prompts cost a single network round-trip.
     """
     # This is a placeholder - replace with actual LLM integration
     # Example: OpenAI, Anthropic, or local model
-    return f"[LLM Response to: {prompt[:50]}...]"
+    return [f"[LLM Response to: {p[:50]}...]" for p in prompts]
+
+def _stream_llm_api(prompt: str, system_prompt: str = "") -> Iterator[str]:
+    """
+    Simulate a streaming LLM call - replace with an actual stream=True call
+
+    Yields response chunks as they arrive instead of one full string.
+    """
+    # This is a placeholder - replace with actual LLM integration
+    response = _call_llm_api([prompt], system_prompt)[0]
+    for i in range(0, len(response), 1024):
+        yield response[i:i + 1024]
+
+def call_llm(prompt: Union[str, List[str]], system_prompt: str = "") -> Union[str, List[str]]:
+    """
+    Call the LLM with a single prompt or a batch of prompts
+
+    Responses are cached on prompt hash, so only uncached prompts are sent
+    to the API; a list input returns a list of responses in the same order.
+    """
+    prompts = [prompt] if isinstance(prompt, str) else prompt
+    keys = [_llm_cache_key(p, system_prompt) for p in prompts]
+    responses = [_llm_cache_get(key) for key in keys]
+
+    # Send only the cache misses to the API
+    missing = [i for i, response in enumerate(responses) if response is None]
+    if missing:
+        fresh = _call_llm_api([prompts[i] for i in missing], system_prompt)
+        for i, response in zip(missing, fresh):
+            _llm_cache_put(keys[i], response)
+            responses[i] = response
+
+    return responses[0] if isinstance(prompt, str) else responses
 
 def get_user_input(prompt: str) -> str:
     """Get input from user with prompt"""
@@ -29,34 +101,153 @@ def confirm_with_user(message: str) -> bool:
     response = input(f"\n{message}\n(y/n): ").lower().strip()
     return response in ['y', 'yes']
 
+# Directories already created by save_to_file - skips the stat+mkdir
+# syscall pair on every repeat write into the same directory
+_mkdir_cache = set()
+
 def save_to_file(content: str, filename: str) -> None:
     """Save content to file"""
-    os.makedirs(os.path.dirname(filename) if os.path.dirname(filename) else ".", exist_ok=True)
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(content)
+    directory = os.path.dirname(filename) or "."
+    if directory not in _mkdir_cache:
+        os.makedirs(directory, exist_ok=True)
+        _mkdir_cache.add(directory)
+    # Encode once and hand the bytes straight to the kernel - skips the
+    # text layer's per-write re-encoding and the buffered copy entirely
+    data = content.encode('utf-8')
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    print(f"✅ File saved: {filename}")
+
+def call_llm_to_file(prompt: str, filename: str, system_prompt: str = "") -> None:
+    """Stream the LLM response for a prompt directly into a file
+
+    Chunks are written as they arrive, so the full response is never held
+    in memory alongside the file copy. Uses the same response cache as
+    call_llm: a hit is written straight from cache, a miss is cached after
+    streaming completes.
+    """
+    key = _llm_cache_key(prompt, system_prompt)
+    cached = _llm_cache_get(key)
+
+    directory = os.path.dirname(filename) or "."
+    if directory not in _mkdir_cache:
+        os.makedirs(directory, exist_ok=True)
+        _mkdir_cache.add(directory)
+
+    with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        if cached is not None:
+            f.write(cached)
+        else:
+            chunks = []
+            for chunk in _stream_llm_api(prompt, system_prompt):
+                f.write(chunk)
+                chunks.append(chunk)
+            _llm_cache_put(key, "".join(chunks))
     print(f"✅ File saved: {filename}")
 
-def execute_command(command: str) -> tuple:
-    """Execute shell command and return (success, output)"""
+def execute_command(command: str, tail_lines: int = 100) -> tuple:
+    """Execute command and return (success, last tail_lines of output)"""
+    # Imported lazily so merely importing this module stays cheap
+    import shlex
+    import subprocess
+    from collections import deque
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout + result.stderr
+        # shell=False avoids spawning an extra /bin/sh per command and
+        # keeps arguments out of shell interpretation. Output is streamed
+        # line by line into a bounded deque so a verbose command can't
+        # balloon memory with a fully buffered transcript
+        proc = subprocess.Popen(
+            shlex.split(command), shell=False,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1 << 16
+        )
+        tail = deque(proc.stdout, maxlen=tail_lines)
+        proc.wait()
+        return proc.returncode == 0, "".join(tail)
     except Exception as e:
         return False, str(e)
 
+# Single-worker executor for speculatively prefetching the next node's LLM
+# call while the current node is still waiting on the user
+_prefetch_executor = ThreadPoolExecutor(max_workers=1)
+
+# libgit2 repository handle, opened once and reused across pushes
+_git_repo = None
+
+def _push_with_pygit2(commit_message: str) -> tuple:
+    """Add, commit and push in-process through libgit2 - no subprocesses"""
+    global _git_repo
+    import pygit2
+
+    if _git_repo is None:
+        _git_repo = pygit2.Repository(".")
+    repo = _git_repo
+
+    index = repo.index
+    index.add_all()
+    index.write()
+    tree = index.write_tree()
+
+    # Mirror git commit's refusal to create empty commits: only commit
+    # when something is staged, and handle the very first commit of a
+    # freshly initialized repository (unborn HEAD, no parent)
+    if repo.head_unborn:
+        if len(index) > 0:
+            signature = repo.default_signature
+            repo.create_commit("HEAD", signature, signature, commit_message, tree, [])
+    elif tree != repo[repo.head.target].tree_id:
+        signature = repo.default_signature
+        repo.create_commit("HEAD", signature, signature, commit_message, tree, [repo.head.target])
+
+    # Default callbacks let libgit2 try the ssh agent; remotes needing a
+    # credential helper raise here and push_to_git falls back to the CLI
+    repo.remotes["origin"].push([repo.head.name], callbacks=pygit2.RemoteCallbacks())
+    return True, ""
+
+def _push_with_subprocess(commit_message: str) -> tuple:
+    """Add, commit and push via one chained git invocation"""
+    import subprocess
+
+    # The commit message is passed as a positional argument so it is
+    # never interpreted by the shell; the staged-diff check skips the
+    # commit when there is nothing new (e.g. retrying a failed push of
+    # an already-created commit) instead of dying on 'nothing to commit'
+    result = subprocess.run(
+        ["sh", "-c",
+         'git add . && { git diff --cached --quiet HEAD 2>/dev/null || git commit -m "$1"; } && git push',
+         "_", commit_message],
+        capture_output=True, text=True
+    )
+    return result.returncode == 0, result.stdout + result.stderr
+
 def push_to_git(commit_message: str) -> bool:
     """Push code to git repository if available"""
     try:
-        # Check if git repo exists
-        success, _ = execute_command("git status")
-        if not success:
+        # Check if git repo exists without spawning a subprocess
+        if not os.path.isdir(".git"):
             print("⚠️  No git repository found, skipping push")
             return True
 
-        # Add, commit and push
-        execute_command("git add .")
-        execute_command(f'git commit -m "{commit_message}"')
-        success, output = execute_command("git push")
+        # Prefer in-process libgit2 when available - it avoids a fork+exec
+        # per push and reuses one repository object across phases
+        try:
+            import pygit2  # noqa: F401
+        except ImportError:
+            success, output = _push_with_subprocess(commit_message)
+        else:
+            try:
+                success, output = _push_with_pygit2(commit_message)
+            except Exception:
+                # pygit2 can fail at runtime where the CLI succeeds (e.g.
+                # remotes that need a credential helper); the CLI path is
+                # safe to rerun because it skips an already-made commit
+                success, output = _push_with_subprocess(commit_message)
 
         if success:
             print("✅ Code pushed to repository successfully")
@@ -68,6 +259,180 @@ def push_to_git(commit_message: str) -> bool:
         print(f"⚠️  Git operations failed: {e}")
         return False
 
+# =============================================================================
+# Prompt Templates
+# =============================================================================
+# Built once at import time; nodes fill in the dynamic parts via format_map
+# instead of re-constructing the static template text on every call. Keeping
+# the templates in one place also stabilizes the LLM cache keys.
+
+_ANALYSIS_PROMPT_TMPL = """
+        Analyze this problem description and identify areas that need clarification:
+
+        Problem: {initial_problem}
+        Context: {context}
+        Tech Stack: {preferred_tech}
+
+        Generate specific questions to clarify:
+        1. Functional requirements
+        2. Non-functional requirements
+        3. User interface needs
+        4. Integration requirements
+        5. Constraints and limitations
+
+        Format as a numbered list of clear, specific questions.
+        """
+
+_REQUIREMENTS_PROMPT_TMPL = """
+        Based on the initial problem and user clarifications, create a comprehensive requirements document:
+
+        Initial Problem: {initial_problem}
+        User Clarifications: {user_responses}
+
+        Create a structured requirements document with:
+        1. Project Overview
+        2. Functional Requirements
+        3. Non-Functional Requirements
+        4. Technical Requirements
+        5. User Interface Requirements
+        6. Success Criteria
+        7. Constraints and Assumptions
+        """
+
+_ARCHITECTURE_PROMPT_TMPL = """
+        Based on these requirements, design a software solution:
+
+        Requirements: {requirements}
+
+        Provide:
+        1. Solution Architecture Overview
+        2. Technology Stack Recommendation
+        3. System Components and Their Interactions
+        4. Data Flow and Storage Strategy
+        5. Key Design Decisions and Rationale
+        """
+
+_PLAN_PROMPT_TMPL = """
+        Create a detailed implementation plan for this solution:
+
+        Architecture: {architecture}
+
+        Break down into:
+        1. Development Phases (with priorities)
+        2. Specific Tasks for Each Phase
+        3. Dependencies Between Tasks
+        4. Estimated Effort and Timeline
+        5. Risk Assessment and Mitigation
+        6. Testing Strategy
+        """
+
+_TASKS_PROMPT_TMPL = """
+        Convert the implementation plan into specific, actionable tasks:
+
+        Plan: {plan}
+
+        Create a task list with:
+        - Task ID
+        - Task Description
+        - Prerequisites
+        - Deliverables
+        - Priority Level
+        """
+
+_CODE_PROMPT_TMPL = """
+            Implement {phase} based on:
+
+            Architecture: {architecture}
+            Plan: {plan}
+
+            Generate actual, working code with:
+            1. Proper file structure
+            2. Clean, documented code
+            3. Error handling
+            4. Best practices
+            """
+
+_TEST_PROMPT_TMPL = """
+                Create comprehensive tests for this component:
+
+                Component: {phase}
+                Code: {code}
+
+                Generate:
+                1. Unit tests
+                2. Integration tests
+                3. Edge cases
+                4. Error handling tests
+                5. Performance tests (if applicable)
+
+                Use appropriate testing framework and include assertions.
+                """
+
+_README_PROMPT_TMPL = """
+        Create a comprehensive README.md file for this project:
+
+        Requirements: {requirements}
+        Architecture: {architecture}
+        Components: {component_phases}
+
+        Include:
+        1. Project Title and Description
+        2. Features and Functionality
+        3. Architecture Overview
+        4. Installation Instructions
+        5. Usage Guide with Examples
+        6. API Documentation (if applicable)
+        7. Contributing Guidelines
+        8. License Information
+        9. Roadmap and Future Plans
+        10. Support and Contact Information
+        """
+
+_CHANGELOG_PROMPT_TMPL = """
+        Create a CHANGELOG.md file documenting the development process:
+
+        Implementation phases: {component_phases}
+        Test results: {test_count} tests
+
+        Format as:
+        # Changelog
+
+        ## [1.0.0] - {date}
+
+        ### Added
+        - List of implemented features
+
+        ### Changed
+        - Any modifications made
+
+        ### Fixed
+        - Issues resolved
+
+        ### Technical
+        - Implementation details
+        """
+
+# =============================================================================
+# Shared State
+# =============================================================================
+
+@dataclass(slots=True)
+class SharedState:
+    """State threaded through the flow - slotted so the per-node prep/post
+    attribute traversals skip the instance dict"""
+    project_id: str
+    start_time: str
+    run_timestamp: str
+    run_date: str
+    current_stage: str = "initialized"
+    problem_data: Optional[Dict] = None
+    clarification_data: Optional[Dict] = None
+    planning_data: Optional[Dict] = None
+    implementation_data: Optional[Dict] = None
+    testing_data: Optional[Dict] = None
+    documentation_data: Optional[Dict] = None
+    arch_future: Optional[Future] = None
+
 # =============================================================================
 # Node 1: Problem Acquisition Agent
 # =============================================================================
@@ -75,7 +440,12 @@ def push_to_git(commit_message: str) -> bool:
 class ProblemAcquisitionNode(Node):
     """First node: Interact with user and acquire the initial problem"""
 
-    def exec(self, _) -> Dict[str, Any]:
+    __slots__ = ()
+
+    def prep(self, shared: SharedState) -> str:
+        return shared.start_time
+
+    def exec(self, start_time: str) -> Dict[str, Any]:
         print("\n🤖 Welcome to the AI Development Assistant!")
         print("I'll help you build a complete software solution from problem to implementation.")
 
@@ -98,12 +468,12 @@ class ProblemAcquisitionNode(Node):
             "initial_problem": problem,
             "context": context,
             "preferred_tech": tech_stack,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": start_time
         }
 
-    def post(self, shared: Dict, prep_res: Any, exec_res: Dict) -> str:
-        shared["problem_data"] = exec_res
-        shared["current_stage"] = "problem_acquired"
+    def post(self, shared: SharedState, prep_res: Any, exec_res: Dict) -> str:
+        shared.problem_data = exec_res
+        shared.current_stage = "problem_acquired"
         print(f"\n✅ Problem acquired: {exec_res['initial_problem'][:100]}...")
         return "problem_clarification"
 
@@ -114,29 +484,20 @@ class ProblemAcquisitionNode(Node):
 class ProblemClarificationNode(Node):
     """Second node: Clarify problem through interactive conversation"""
 
-    def prep(self, shared: Dict) -> Dict:
-        return shared["problem_data"]
+    __slots__ = ()
+
+    def prep(self, shared: SharedState) -> Dict:
+        return shared.problem_data
 
     def exec(self, problem_data: Dict) -> Dict:
         print("\n🔍 Let me clarify your requirements...")
 
         # Analyze initial problem with LLM
-        analysis_prompt = f"""
-        Analyze this problem description and identify areas that need clarification:
-
-        Problem: {problem_data['initial_problem']}
-        Context: {problem_data['context']}
-        Tech Stack: {problem_data['preferred_tech']}
-
-        Generate specific questions to clarify:
-        1. Functional requirements
-        2. Non-functional requirements
-        3. User interface needs
-        4. Integration requirements
-        5. Constraints and limitations
-
-        Format as a numbered list of clear, specific questions.
-        """
+        analysis_prompt = _ANALYSIS_PROMPT_TMPL.format_map({
+            "initial_problem": problem_data['initial_problem'],
+            "context": problem_data['context'],
+            "preferred_tech": problem_data['preferred_tech']
+        })
 
         questions = call_llm(analysis_prompt)
 
@@ -150,21 +511,10 @@ class ProblemClarificationNode(Node):
         )
 
         # Generate comprehensive requirements document
-        requirements_prompt = f"""
-        Based on the initial problem and user clarifications, create a comprehensive requirements document:
-
-        Initial Problem: {problem_data['initial_problem']}
-        User Clarifications: {detailed_requirements}
-
-        Create a structured requirements document with:
-        1. Project Overview
-        2. Functional Requirements
-        3. Non-Functional Requirements
-        4. Technical Requirements
-        5. User Interface Requirements
-        6. Success Criteria
-        7. Constraints and Assumptions
-        """
+        requirements_prompt = _REQUIREMENTS_PROMPT_TMPL.format_map({
+            "initial_problem": problem_data['initial_problem'],
+            "user_responses": detailed_requirements
+        })
 
         requirements_doc = call_llm(requirements_prompt)
 
@@ -175,16 +525,24 @@ class ProblemClarificationNode(Node):
             "clarification_complete": True
         }
 
-    def post(self, shared: Dict, prep_res: Dict, exec_res: Dict) -> str:
-        shared["clarification_data"] = exec_res
+    def post(self, shared: SharedState, prep_res: Dict, exec_res: Dict) -> str:
+        shared.clarification_data = exec_res
+
+        # Kick off the architecture call for the planning node now - it only
+        # needs the requirements document, so it can overlap with the file
+        # save and stage transition instead of blocking planning later
+        shared.arch_future = _prefetch_executor.submit(
+            call_llm,
+            _ARCHITECTURE_PROMPT_TMPL.format_map({"requirements": exec_res["requirements_document"]})
+        )
 
         # Save user_requirements.md
         requirements_content = f"""# User Requirements Document
 
-## Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+## Generated on: {shared.run_timestamp}
 
 ## Initial Problem
-{shared['problem_data']['initial_problem']}
+{shared.problem_data['initial_problem']}
 
 ## Clarification Process
 {exec_res['clarification_questions']}
@@ -197,7 +555,7 @@ class ProblemClarificationNode(Node):
 """
 
         save_to_file(requirements_content, "user_requirements.md")
-        shared["current_stage"] = "requirements_clarified"
+        shared.current_stage = "requirements_clarified"
         print("\n✅ Requirements clarified and documented")
         return "solution_planning"
 
@@ -208,61 +566,36 @@ class ProblemClarificationNode(Node):
 class SolutionPlanningNode(Node):
     """Third node: Find solution and create implementation plan"""
 
-    def prep(self, shared: Dict) -> Dict:
+    __slots__ = ()
+
+    def prep(self, shared: SharedState) -> Dict:
+        arch_future, shared.arch_future = shared.arch_future, None
         return {
-            "requirements": shared["clarification_data"]["requirements_document"],
-            "problem_data": shared["problem_data"]
+            "requirements": shared.clarification_data["requirements_document"],
+            "problem_data": shared.problem_data,
+            "arch_future": arch_future
         }
 
     def exec(self, data: Dict) -> Dict:
         print("\n📋 Creating solution plan...")
 
-        # Generate solution architecture
-        architecture_prompt = f"""
-        Based on these requirements, design a software solution:
-
-        Requirements: {data['requirements']}
-
-        Provide:
-        1. Solution Architecture Overview
-        2. Technology Stack Recommendation
-        3. System Components and Their Interactions
-        4. Data Flow and Storage Strategy
-        5. Key Design Decisions and Rationale
-        """
-
-        solution_architecture = call_llm(architecture_prompt)
+        # Use the prefetched architecture response if the clarification node
+        # started one; otherwise issue the call here
+        arch_future = data.get("arch_future")
+        if arch_future is not None:
+            solution_architecture = arch_future.result()
+        else:
+            solution_architecture = call_llm(
+                _ARCHITECTURE_PROMPT_TMPL.format_map({"requirements": data["requirements"]})
+            )
 
         # Generate implementation plan
-        plan_prompt = f"""
-        Create a detailed implementation plan for this solution:
-
-        Architecture: {solution_architecture}
-
-        Break down into:
-        1. Development Phases (with priorities)
-        2. Specific Tasks for Each Phase
-        3. Dependencies Between Tasks
-        4. Estimated Effort and Timeline
-        5. Risk Assessment and Mitigation
-        6. Testing Strategy
-        """
+        plan_prompt = _PLAN_PROMPT_TMPL.format_map({"architecture": solution_architecture})
 
         implementation_plan = call_llm(plan_prompt)
 
         # Generate task breakdown
-        tasks_prompt = f"""
-        Convert the implementation plan into specific, actionable tasks:
-
-        Plan: {implementation_plan}
-
-        Create a task list with:
-        - Task ID
-        - Task Description
-        - Prerequisites
-        - Deliverables
-        - Priority Level
-        """
+        tasks_prompt = _TASKS_PROMPT_TMPL.format_map({"plan": implementation_plan})
 
         task_breakdown = call_llm(tasks_prompt)
 
@@ -273,13 +606,13 @@ class SolutionPlanningNode(Node):
             "planning_complete": True
         }
 
-    def post(self, shared: Dict, prep_res: Dict, exec_res: Dict) -> str:
-        shared["planning_data"] = exec_res
+    def post(self, shared: SharedState, prep_res: Dict, exec_res: Dict) -> str:
+        shared.planning_data = exec_res
 
         # Save plan_and_tasks.md
         plan_content = f"""# Solution Plan and Tasks
 
-## Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+## Generated on: {shared.run_timestamp}
 
 ## Solution Architecture
 {exec_res['solution_architecture']}
@@ -292,7 +625,7 @@ class SolutionPlanningNode(Node):
 """
 
         save_to_file(plan_content, "plan_and_tasks.md")
-        shared["current_stage"] = "solution_planned"
+        shared.current_stage = "solution_planned"
         print("\n✅ Solution planned and tasks defined")
         return "implementation"
 
@@ -303,11 +636,14 @@ class SolutionPlanningNode(Node):
 class ImplementationNode(Node):
     """Fourth node: Implement solution step by step with user confirmation"""
 
-    def prep(self, shared: Dict) -> Dict:
+    __slots__ = ()
+
+    def prep(self, shared: SharedState) -> Dict:
         return {
-            "plan": shared["planning_data"]["implementation_plan"],
-            "tasks": shared["planning_data"]["task_breakdown"],
-            "architecture": shared["planning_data"]["solution_architecture"]
+            "plan": shared.planning_data["implementation_plan"],
+            "tasks": shared.planning_data["task_breakdown"],
+            "architecture": shared.planning_data["solution_architecture"],
+            "timestamp": shared.start_time
         }
 
     def exec(self, data: Dict) -> Dict:
@@ -328,50 +664,52 @@ class ImplementationNode(Node):
             "Integration and Data Handling"
         ]
 
-        for i, phase in enumerate(phases, 1):
-            print(f"\n🔧 Phase {i}: {phase}")
-
-            # Generate code for this phase
-            code_prompt = f"""
-            Implement {phase} based on:
-
-            Architecture: {data['architecture']}
-            Plan: {data['plan']}
-
-            Generate actual, working code with:
-            1. Proper file structure
-            2. Clean, documented code
-            3. Error handling
-            4. Best practices
-            """
-
-            generated_code = call_llm(code_prompt)
-
-            print(f"Generated code for {phase}:")
-            print(f"{generated_code[:200]}...")
-
-            # Get user confirmation
-            if confirm_with_user(f"Approve implementation for {phase}?"):
-                # Save code files (simplified - would generate actual files)
-                filename = f"phase_{i}_{phase.lower().replace(' ', '_')}.py"
-                save_to_file(generated_code, f"src/{filename}")
-
-                implemented_components.append({
-                    "phase": phase,
-                    "filename": filename,
-                    "code": generated_code,
-                    "approved": True,
-                    "timestamp": datetime.now().isoformat()
-                })
-
-                # Push to git if user confirms
-                if confirm_with_user("Push this phase to repository?"):
-                    push_to_git(f"Implement {phase}")
-
-                implementation_log.append(f"✅ {phase} - Completed and approved")
-            else:
-                implementation_log.append(f"❌ {phase} - Rejected by user")
-                print(f"Phase {phase} rejected. Please provide feedback for revision.")
+        # Generate code for all phases concurrently - the LLM calls are
+        # network-bound and independent of each other, so issuing them in
+        # parallel turns N round-trips into roughly one
+        code_prompts = [_CODE_PROMPT_TMPL.format_map({
+            "phase": phase,
+            "architecture": data['architecture'],
+            "plan": data['plan']
+        }) for phase in phases]
+
+        # Review and approval must stay serial because of user interaction,
+        # but consuming the futures one at a time means later phases keep
+        # generating in the background while the user is reading and
+        # confirming earlier ones - their thinking time hides the latency
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            code_futures = [executor.submit(call_llm, p) for p in code_prompts]
+
+            for i, (phase, code_future) in enumerate(zip(phases, code_futures), 1):
+                print(f"\n🔧 Phase {i}: {phase}")
+
+                generated_code = code_future.result()
+
+                print(f"Generated code for {phase}:")
+                print(f"{generated_code[:200]}...")
+
+                # Get user confirmation
+                if confirm_with_user(f"Approve implementation for {phase}?"):
+                    # Save code files (simplified - would generate actual files)
+                    filename = f"phase_{i}_{phase.lower().replace(' ', '_')}.py"
+                    save_to_file(generated_code, f"src/{filename}")
+
+                    implemented_components.append({
+                        "phase": phase,
+                        "filename": filename,
+                        "code": generated_code,
+                        "approved": True,
+                        "timestamp": data["timestamp"]
+                    })
+
+                    # Push to git if user confirms
+                    if confirm_with_user("Push this phase to repository?"):
+                        push_to_git(f"Implement {phase}")
+
+                    implementation_log.append(f"✅ {phase} - Completed and approved")
+                else:
+                    implementation_log.append(f"❌ {phase} - Rejected by user")
+                    print(f"Phase {phase} rejected. Please provide feedback for revision.")
 
         return {
             "implemented_components": implemented_components,
@@ -379,9 +717,9 @@ class ImplementationNode(Node):
             "implementation_complete": True
         }
 
-    def post(self, shared: Dict, prep_res: Dict, exec_res: Dict) -> str:
-        shared["implementation_data"] = exec_res
-        shared["current_stage"] = "implementation_complete"
+    def post(self, shared: SharedState, prep_res: Dict, exec_res: Dict) -> str:
+        shared.implementation_data = exec_res
+        shared.current_stage = "implementation_complete"
 
         print(f"\n✅ Implementation completed with {len(exec_res['implemented_components'])} components")
         return "testing"
@@ -393,10 +731,12 @@ class ImplementationNode(Node):
 class TestingNode(Node):
     """Fifth node: Create and run tests until all pass"""
 
-    def prep(self, shared: Dict) -> Dict:
+    __slots__ = ()
+
+    def prep(self, shared: SharedState) -> Dict:
         return {
-            "components": shared["implementation_data"]["implemented_components"],
-            "architecture": shared["planning_data"]["solution_architecture"]
+            "components": shared.implementation_data["implemented_components"],
+            "architecture": shared.planning_data["solution_architecture"]
         }
 
     def exec(self, data: Dict) -> Dict:
@@ -413,28 +753,17 @@ class TestingNode(Node):
 
             current_test_results = []
 
-            # Generate tests for each component
-            for component in data["components"]:
-                print(f"Testing {component['phase']}...")
-
-                # Generate test cases
-                test_prompt = f"""
-                Create comprehensive tests for this component:
-
-                Component: {component['phase']}
-                Code: {component['code']}
-
-                Generate:
-                1. Unit tests
-                2. Integration tests
-                3. Edge cases
-                4. Error handling tests
-                5. Performance tests (if applicable)
+            # Build all test prompts up front and send them as one batched
+            # LLM request - a single round-trip instead of one per component
+            test_prompts = [_TEST_PROMPT_TMPL.format_map({
+                "phase": component['phase'],
+                "code": component['code']
+            }) for component in data["components"]]
 
-                Use appropriate testing framework and include assertions.
-                """
+            test_codes = call_llm(test_prompts)
 
-                test_code = call_llm(test_prompt)
+            for component, test_code in zip(data["components"], test_codes):
+                print(f"Testing {component['phase']}...")
 
                 # Simulate running tests
                 # In real implementation, would execute actual tests
@@ -454,7 +783,7 @@ class TestingNode(Node):
                 save_to_file(test_code, test_filename)
 
             # Check if all tests passed
-            all_tests_passed = all([result["passed"] for result in current_test_results])
+            all_tests_passed = all(result["passed"] for result in current_test_results)
             test_results.extend(current_test_results)
 
             if not all_tests_passed:
@@ -486,13 +815,13 @@ class TestingNode(Node):
             "testing_complete": True
         }
 
-    def post(self, shared: Dict, prep_res: Dict, exec_res: Dict) -> str:
-        shared["testing_data"] = exec_res
+    def post(self, shared: SharedState, prep_res: Dict, exec_res: Dict) -> str:
+        shared.testing_data = exec_res
 
         # Save test_cases_report.md
         save_to_file(exec_res["test_report"], "test_cases_report.md")
 
-        shared["current_stage"] = "testing_complete"
+        shared.current_stage = "testing_complete"
         print(f"\n✅ Testing completed - All tests passed: {exec_res['all_tests_passed']}")
         return "documentation"
 
@@ -500,87 +829,71 @@ class TestingNode(Node):
 # Node 6: Documentation Agent
 # =============================================================================
 
+# Installation section of the generated README: everything between the
+# "## Installation" heading and the next section (or end of file)
+_INSTALL_RE = re.compile(r"## Installation(.*?)(?=##|\Z)", re.DOTALL)
+
 class DocumentationNode(Node):
     """Sixth node: Generate README.md and changelog.md"""
 
-    def prep(self, shared: Dict) -> Dict:
+    __slots__ = ()
+
+    def prep(self, shared: SharedState) -> Dict:
         return {
-            "requirements": shared["clarification_data"]["requirements_document"],
-            "architecture": shared["planning_data"]["solution_architecture"],
-            "components": shared["implementation_data"]["implemented_components"],
-            "test_results": shared["testing_data"]["test_results"]
+            "requirements": shared.clarification_data["requirements_document"],
+            "architecture": shared.planning_data["solution_architecture"],
+            "components": shared.implementation_data["implemented_components"],
+            "test_results": shared.testing_data["test_results"],
+            "run_date": shared.run_date
         }
 
     def exec(self, data: Dict) -> Dict:
         print("\n📚 Generating documentation...")
 
-        # Generate README.md
-        readme_prompt = f"""
-        Create a comprehensive README.md file for this project:
-
-        Requirements: {data['requirements']}
-        Architecture: {data['architecture']}
-        Components: {[c['phase'] for c in data['components']]}
+        component_phases = [c['phase'] for c in data['components']]
 
-        Include:
-        1. Project Title and Description
-        2. Features and Functionality
-        3. Architecture Overview
-        4. Installation Instructions
-        5. Usage Guide with Examples
-        6. API Documentation (if applicable)
-        7. Contributing Guidelines
-        8. License Information
-        9. Roadmap and Future Plans
-        10. Support and Contact Information
-        """
+        # Generate README.md
+        readme_prompt = _README_PROMPT_TMPL.format_map({
+            "requirements": data['requirements'],
+            "architecture": data['architecture'],
+            "component_phases": component_phases
+        })
 
         readme_content = call_llm(readme_prompt)
 
-        # Generate changelog
-        changelog_prompt = f"""
-        Create a CHANGELOG.md file documenting the development process:
-
-        Implementation phases: {[c['phase'] for c in data['components']]}
-        Test results: {len(data['test_results'])} tests
-
-        Format as:
-        # Changelog
-
-        ## [1.0.0] - {datetime.now().strftime('%Y-%m-%d')}
-
-        ### Added
-        - List of implemented features
-
-        ### Changed
-        - Any modifications made
-
-        ### Fixed
-        - Issues resolved
-
-        ### Technical
-        - Implementation details
-        """
-
-        changelog_content = call_llm(changelog_prompt)
+        # Generate changelog - streamed straight into CHANGELOG.md since
+        # nothing downstream needs the content in memory
+        changelog_prompt = _CHANGELOG_PROMPT_TMPL.format_map({
+            "component_phases": component_phases,
+            "test_count": len(data['test_results']),
+            "date": data['run_date']
+        })
+
+        call_llm_to_file(changelog_prompt, "CHANGELOG.md")
+
+        # Generate additional documentation (the README stays in memory
+        # because the installation guide is extracted from it)
+        install_match = _INSTALL_RE.search(readme_content)
+        install_guide = (
+            "# Installation Guide\n\n" + install_match.group(1)
+            if install_match
+            else "# Installation Guide\n\nDetailed installation instructions will be added here."
+        )
 
-        # Generate additional documentation
         docs_structure = {
             "README.md": readme_content,
-            "CHANGELOG.md": changelog_content,
             "docs/ARCHITECTURE.md": data['architecture'],
-            "docs/INSTALLATION.md": "# Installation Guide\n\n" + readme_content.split("## Installation")[1].split("##")[0] if "## Installation" in readme_content else "# Installation Guide\n\nDetailed installation instructions will be added here."
+            "docs/INSTALLATION.md": install_guide
         }
 
         return {
             "readme_content": readme_content,
-            "changelog_content": changelog_content,
             "docs_structure": docs_structure,
             "documentation_complete": True
         }
 
-    def post(self, shared: Dict, prep_res: Dict, exec_res: Dict) -> str:
-        shared["documentation_data"] = exec_res
+    def post(self, shared: SharedState, prep_res: Dict, exec_res: Dict) -> str:
+        shared.documentation_data = exec_res
 
         # Save all documentation files
         for filename, content in exec_res["docs_structure"].items():
@@ -590,7 +903,7 @@ class DocumentationNode(Node):
         if confirm_with_user("Push final documentation to repository?"):
             push_to_git("Add comprehensive documentation and changelog")
 
-        shared["current_stage"] = "project_complete"
+        shared.current_stage = "project_complete"
         print("\n🎉 Project completed successfully!")
 
         # Print final summary
@@ -599,7 +912,7 @@ class DocumentationNode(Node):
         print("="*60)
         print(f"✅ Requirements: user_requirements.md")
         print(f"✅ Planning: plan_and_tasks.md")
-        print(f"✅ Implementation: {len(shared['implementation_data']['implemented_components'])} components")
+        print(f"✅ Implementation: {len(shared.implementation_data['implemented_components'])} components")
         print(f"✅ Testing: test_cases_report.md")
         print(f"✅ Documentation: README.md, CHANGELOG.md")
         print("="*60)
@@ -636,18 +949,18 @@ def main():
     print("Based on Pocket Flow Framework")
     print("-" * 50)
 
+    # Take one timestamp for the whole run - every node reuses it instead
+    # of calling datetime.now() itself, and keeping the date out of prompt
+    # variability means identical re-runs hit the LLM response cache
+    run_time = datetime.now()
+
     # Initialize shared state
-    shared = {
-        "project_id": f"project_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-        "start_time": datetime.now().isoformat(),
-        "current_stage": "initialized",
-        "problem_data": None,
-        "clarification_data": None,
-        "planning_data": None,
-        "implementation_data": None,
-        "testing_data": None,
-        "documentation_data": None
-    }
+    shared = SharedState(
+        project_id=f"project_{run_time.strftime(_PROJECT_ID_FMT)}",
+        start_time=run_time.isoformat(),
+        run_timestamp=run_time.strftime(_TS_FMT),
+        run_date=run_time.strftime(_DATE_FMT)
+    )
 
     # Create and run the flow
     try:
@@ -655,16 +968,16 @@ def main():
         dev_flow.run(shared)
 
         print(f"\n🎉 Development flow completed successfully!")
-        print(f"Project ID: {shared['project_id']}")
-        print(f"Final Stage: {shared['current_stage']}")
+        print(f"Project ID: {shared.project_id}")
+        print(f"Final Stage: {shared.current_stage}")
 
     except KeyboardInterrupt:
         print(f"\n⚠️  Flow interrupted by user")
-        print(f"Current stage: {shared.get('current_stage', 'unknown')}")
+        print(f"Current stage: {shared.current_stage}")
 
     except Exception as e:
         print(f"\n❌ Error during execution: {e}")
-        print(f"Current stage: {shared.get('current_stage', 'unknown')}")
+        print(f"Current stage: {shared.current_stage}")
 
 if __name__ == "__main__":
     main()